@@ -2,21 +2,366 @@
 Async Gamma API Client for Polymarket Markets
 
 Converted from sync httpx to async aiohttp for better performance
-and concurrent market fetching.
+and concurrent market fetching. Pass http2=True (or use
+AsyncGammaMarketClient.instance()) to multiplex requests over a single
+HTTP/2 connection with httpx instead.
+
+Pydantic is only imported once a parse_pydantic path is used, so callers
+that stick to raw dicts or msgspec structs (parse_struct) never load it.
+
+For best throughput run the event loop on uvloop where available (it is not
+on Windows): use uvloop.run() in place of asyncio.run(), as __main__ does.
 """
 
+from __future__ import annotations
+
 import asyncio
+import contextlib
+import functools
+from concurrent.futures import ProcessPoolExecutor
 import json
-from typing import List, Dict, Optional
+import math
+import multiprocessing
+from types import MappingProxyType
+from typing import List, Dict, Optional, Sequence
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 try:
     import aiohttp
+    import yarl
     HAS_AIOHTTP = True
 except ImportError:
     HAS_AIOHTTP = False
     print("Warning: aiohttp not installed. Install with: pip install aiohttp")
 
-from agents.agents.utils.objects import Market, PolymarketEvent, ClobReward, Tag
+from agents.agents.utils.parsing import parse_outcome_prices
+
+try:
+    import brotli  # noqa: F401 - lets aiohttp decode "br" responses
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+try:
+    import h2  # noqa: F401 - required by httpx for HTTP/2
+    import httpx
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+try:
+    from cachetools import TTLCache
+    HAS_CACHETOOLS = True
+except ImportError:
+    HAS_CACHETOOLS = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+try:
+    import simdjson
+    HAS_SIMDJSON = True
+except ImportError:
+    HAS_SIMDJSON = False
+
+if HAS_SIMDJSON:
+    # Reused across calls. Only touched synchronously on the event loop, and
+    # every proxy into a parsed document is dropped before the next parse.
+    _SIMDJSON_PARSER = simdjson.Parser()
+
+try:
+    import msgspec
+    from agents.agents.utils.structs import EventStruct, MarketStruct
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+if HAS_MSGSPEC:
+    # strict=False lets numeric fields arrive as strings, as Gamma sends them
+    _MARKETS_DECODER = msgspec.json.Decoder(list[MarketStruct], strict=False)
+    _EVENTS_DECODER = msgspec.json.Decoder(list[EventStruct], strict=False)
+
+# Pydantic models and validators, filled in by _load_pydantic() on first use.
+# Entry points load them once; the per-item parsers assume they are loaded.
+_MARKET_MODEL = _EVENT_MODEL = _CLOB_REWARD_MODEL = _TAG_MODEL = None
+_VALIDATION_ERROR = None
+_MARKETS_ADAPTER = _EVENTS_ADAPTER = _MARKET_ADAPTER = _EVENT_ADAPTER = None
+_CLOB_REWARD_ADAPTER = _TAG_ADAPTER = None
+
+# Public names resolved lazily by __getattr__, mapped to their globals above
+_LAZY_PYDANTIC_NAMES = {
+    "Market": "_MARKET_MODEL",
+    "PolymarketEvent": "_EVENT_MODEL",
+    "ClobReward": "_CLOB_REWARD_MODEL",
+    "Tag": "_TAG_MODEL",
+    "ValidationError": "_VALIDATION_ERROR",
+}
+
+
+def _load_pydantic() -> None:
+    """
+    Import the Pydantic models and build their validators on first use.
+
+    The adapters are built once so validate_json() can parse response bytes
+    in a single pass, and the per-item parsers skip model schema lookups.
+    """
+    global _MARKET_MODEL, _EVENT_MODEL, _CLOB_REWARD_MODEL, _TAG_MODEL
+    global _VALIDATION_ERROR
+    global _MARKETS_ADAPTER, _EVENTS_ADAPTER, _MARKET_ADAPTER, _EVENT_ADAPTER
+    global _CLOB_REWARD_ADAPTER, _TAG_ADAPTER
+    if _TAG_ADAPTER is not None:
+        return
+    
+    from pydantic import TypeAdapter, ValidationError
+    from agents.agents.utils.objects import Market, PolymarketEvent, ClobReward, Tag
+
+    _MARKET_MODEL = Market
+    _EVENT_MODEL = PolymarketEvent
+    _CLOB_REWARD_MODEL = ClobReward
+    _TAG_MODEL = Tag
+    _VALIDATION_ERROR = ValidationError
+    _MARKETS_ADAPTER = TypeAdapter(list[Market])
+    _EVENTS_ADAPTER = TypeAdapter(list[PolymarketEvent])
+    _MARKET_ADAPTER = TypeAdapter(Market)
+    _EVENT_ADAPTER = TypeAdapter(PolymarketEvent)
+    _CLOB_REWARD_ADAPTER = TypeAdapter(ClobReward)
+    _TAG_ADAPTER = TypeAdapter(Tag)
+
+
+def __getattr__(name: str):
+    """Import the Pydantic models when they are accessed from outside (PEP 562)."""
+    if name in _LAZY_PYDANTIC_NAMES:
+        _load_pydantic()
+        return globals()[_LAZY_PYDANTIC_NAMES[name]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _json_loads(data: bytes | str):
+    """Decode JSON with orjson when available, falling back to stdlib json."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data) -> str:
+    """Encode JSON with orjson when available, falling back to stdlib json."""
+    if HAS_ORJSON:
+        return orjson.dumps(data).decode()
+    return json.dumps(data)
+
+
+# Compressed JSON is a fraction of the size on the wire; aiohttp decompresses
+# in C as the body is read. Only advertise brotli when we can decode it.
+_ACCEPT_ENCODING = "br, gzip" if HAS_BROTLI else "gzip, deflate"
+
+# Shared filter for "current" market/event queries. Values are pre-stringified
+# because aiohttp rejects bool query params.
+_ACTIVE_BASE = MappingProxyType(
+    {"active": "true", "closed": "false", "archived": "false"}
+)
+
+# With use_processes, responses at least this large are parsed across a
+# process pool, in chunks
+_PROCESS_POOL_MIN_MARKETS = 1000
+_PARSE_CHUNK_SIZE = 32
+_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+
+
+@functools.lru_cache(maxsize=256)
+def _build_url(endpoint: str, params: frozenset) -> "yarl.URL":
+    """Encode an endpoint and its query once per distinct parameter set."""
+    query = sorted((name, value) for name, _, value in params)
+    return yarl.URL(endpoint).with_query(query)
+
+
+def _query_url(endpoint: str, params: Dict) -> "yarl.URL":
+    """Return a pre-encoded URL for endpoint + params, cached when hashable."""
+    try:
+        # Keyed on the value types too, since True == 1 == 1.0 but yarl
+        # encodes (or rejects) each differently
+        key = frozenset(
+            (name, type(value), value) for name, value in params.items()
+        )
+    except TypeError:
+        # Unhashable values (e.g. lists) can't be cached, encode them directly
+        return yarl.URL(endpoint).with_query(params)
+    return _build_url(endpoint, key)
+
+
+def _project_markets(raw: bytes, fields: Sequence[str]) -> List[Dict]:
+    """Decode a /markets response keeping only the given keys of each market."""
+    if not HAS_SIMDJSON:
+        return [
+            {key: market[key] for key in fields if key in market}
+            for market in _json_loads(raw)
+        ]
+    
+    markets = []
+    for market in _SIMDJSON_PARSER.parse(raw):
+        projected = {}
+        for key in fields:
+            if key not in market:
+                continue
+            value = market[key]
+            if isinstance(value, simdjson.Object):
+                value = value.as_dict()
+            elif isinstance(value, simdjson.Array):
+                value = value.as_list()
+            projected[key] = value
+        markets.append(projected)
+    return markets
+
+
+def _validate_list(adapter, items: list, label: str, err=None) -> list:
+    """
+    Validate a list of raw objects in one pass, dropping the invalid ones.
+
+    The failing indices are read off the ValidationError (err, when the
+    caller already has one), and the remaining items are validated again.
+    A body that isn't a list at all (e.g. an error object) yields no items.
+    """
+    if err is None:
+        try:
+            return adapter.validate_python(items)
+        except _VALIDATION_ERROR as validation_err:
+            err = validation_err
+    
+    bad = {
+        error["loc"][0]
+        for error in err.errors()
+        if error["loc"] and isinstance(error["loc"][0], int)
+    }
+    if not bad:
+        print(f"[{label}] Expected a list of objects: {err}")
+        return []
+    print(f"[{label}] Dropping invalid entries at {sorted(bad)}: {err}")
+    return adapter.validate_python(
+        [item for index, item in enumerate(items) if index not in bad]
+    )
+
+
+def _parse_market(market_object: dict, trust_api: bool) -> Optional[Market]:
+    """Parse a raw market dict, see AsyncGammaMarketClient.parse_pydantic_market."""
+    try:
+        if "clobRewards" in market_object:
+            if trust_api:
+                market_object["clobRewards"] = [
+                    _CLOB_REWARD_MODEL.model_construct(**clob_rewards_obj)
+                    for clob_rewards_obj in market_object["clobRewards"]
+                ]
+            else:
+                market_object["clobRewards"] = [
+                    _CLOB_REWARD_ADAPTER.validate_python(clob_rewards_obj)
+                    for clob_rewards_obj in market_object["clobRewards"]
+                ]
+
+        if "events" in market_object:
+            market_object["events"] = [
+                _parse_event(market_event_obj, trust_api)
+                for market_event_obj in market_object["events"]
+            ]
+
+        # These two fields are returned as stringified lists from API
+        if "outcomePrices" in market_object:
+            market_object["outcomePrices"] = parse_outcome_prices(
+                market_object["outcomePrices"]
+            )
+        if "clobTokenIds" in market_object:
+            market_object["clobTokenIds"] = _json_loads(
+                market_object["clobTokenIds"]
+            )
+
+        if trust_api:
+            return _MARKET_MODEL.model_construct(**market_object)
+        return _MARKET_ADAPTER.validate_python(market_object)
+    except Exception as err:
+        print(f"[parse_market] Caught exception: {err}")
+        print("exception while handling object:", market_object)
+        return None
+
+
+def _parse_tags_inplace(event_object: dict, trust_api: bool) -> None:
+    """Replace the raw tag dicts of an event with Tag models."""
+    tags = event_object.get("tags")
+    if not tags:
+        return
+    if trust_api:
+        event_object["tags"] = [_TAG_MODEL.model_construct(**tag) for tag in tags]
+    else:
+        event_object["tags"] = [_TAG_ADAPTER.validate_python(tag) for tag in tags]
+
+
+def _parse_event(event_object: dict, trust_api: bool) -> Optional[PolymarketEvent]:
+    """Parse a raw event dict, top-level or nested under a market."""
+    try:
+        _parse_tags_inplace(event_object, trust_api)
+        if trust_api:
+            return _EVENT_MODEL.model_construct(**event_object)
+        return _EVENT_ADAPTER.validate_python(event_object)
+    except Exception as err:
+        print(f"[parse_event] Caught exception: {err}")
+        print("\n", event_object)
+        return None
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Lazy initialization of the process pool used for bulk parsing."""
+    global _PROCESS_POOL
+    if _PROCESS_POOL is None:
+        # Forking a process that runs an event loop and open sockets is
+        # unsafe; spawn starts clean workers and is available on every OS
+        _PROCESS_POOL = ProcessPoolExecutor(
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _PROCESS_POOL
+
+
+def _parse_market_chunk(chunk: List[Dict], trust_api: bool) -> List[Market]:
+    """Parse a chunk of raw market dicts. Module-level so it can be pickled."""
+    _load_pydantic()
+    if not trust_api:
+        return _validate_list(_MARKETS_ADAPTER, chunk, "parse_markets")
+    
+    markets = [_parse_market(market_object, trust_api) for market_object in chunk]
+    return [market for market in markets if market]
+
+
+class _ChunkReader:
+    """Async file-like view over an httpx byte stream, as ijson expects."""
+    
+    def __init__(self, chunks):
+        self._chunks = chunks
+    
+    async def read(self, n: int = -1) -> bytes:
+        # ijson probes with read(0) to check the stream returns bytes
+        if n == 0:
+            return b""
+        # and treats b"" as end of stream, so skip any empty chunks
+        async for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
+
+
+class _HttpxResponse:
+    """The subset of aiohttp's ClientResponse API the client relies on."""
+    
+    def __init__(self, resp: "httpx.Response"):
+        self._resp = resp
+        self.status = resp.status_code
+        self.headers = resp.headers
+        self.content = _ChunkReader(resp.aiter_bytes(65536))
+    
+    async def read(self) -> bytes:
+        return await self._resp.aread()
 
 
 class AsyncGammaMarketClient:
@@ -27,92 +372,199 @@ class AsyncGammaMarketClient:
     - Concurrent market fetching with asyncio.gather()
     - No thread context-switching overhead
     - Better for 50+ market monitoring
+    
+    Clients share one connection pool per event loop. close() releases it
+    once the last open client closes; close_connector() releases it early.
     """
     
-    def __init__(self):
+    _instance: Optional["AsyncGammaMarketClient"] = None
+    
+    def __init__(self, http2: bool = False):
+        if http2 and not HAS_HTTP2:
+            raise ImportError(
+                "httpx with HTTP/2 is required. Install with: pip install httpx[http2]"
+            )
+        
         self.gamma_url = "https://gamma-api.polymarket.com"
         self.gamma_markets_endpoint = self.gamma_url + "/markets"
         self.gamma_events_endpoint = self.gamma_url + "/events"
+        self.http2 = http2
         self._session: Optional[aiohttp.ClientSession] = None
+        self._http2_client: Optional["httpx.AsyncClient"] = None
+        # Loops the session and client were created on; both are unusable
+        # from another loop, e.g. the shared instance across asyncio.run()
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._http2_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        # get_market() requests in flight, shared by concurrent callers
+        self._inflight: dict[str, asyncio.Task] = {}
+        # Short-lived cache to absorb bursts of get_market() calls
+        self._market_cache = TTLCache(maxsize=1024, ttl=2) if HAS_CACHETOOLS else None
+    
+    @classmethod
+    def instance(cls) -> "AsyncGammaMarketClient":
+        """
+        Return the process-wide shared client.
+
+        Uses HTTP/2 when httpx and h2 are installed, so concurrent page
+        requests are multiplexed over one connection.
+        """
+        if cls._instance is None:
+            cls._instance = cls(http2=HAS_HTTP2)
+        return cls._instance
+    
+    # Connection pool shared by every client instance on the same event loop,
+    # so re-created clients keep their warm keep-alive connections
+    _connector: Optional["aiohttp.TCPConnector"] = None
+    _connector_loop: Optional[asyncio.AbstractEventLoop] = None
+    # Open sessions on the shared connector; the last close() releases it
+    _connector_sessions: int = 0
+    
+    # Whether Gamma answered the last count probe with a total header. Once it
+    # is known to be missing, pagination stops paying for the probe request.
+    _total_count_supported: Optional[bool] = None
+    
+    @classmethod
+    def _get_connector(cls) -> aiohttp.TCPConnector:
+        """Lazy initialization of the shared keep-alive connection pool."""
+        loop = asyncio.get_running_loop()
+        if (
+            cls._connector is None
+            or cls._connector.closed
+            or cls._connector_loop is not loop
+        ):
+            cls._connector = aiohttp.TCPConnector(
+                limit=32,
+                limit_per_host=16,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+                enable_cleanup_closed=True,
+            )
+            cls._connector_loop = loop
+            cls._connector_sessions = 0
+        return cls._connector
     
     async def _get_session(self) -> aiohttp.ClientSession:
         """Lazy initialization of aiohttp session."""
         if not HAS_AIOHTTP:
             raise ImportError("aiohttp is required. Install with: pip install aiohttp")
         
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is None
+            or self._session.closed
+            or self._session_loop is not loop
+        ):
+            self._session = aiohttp.ClientSession(
+                connector=self._get_connector(),
+                connector_owner=False,
+                timeout=aiohttp.ClientTimeout(total=30, sock_connect=5),
+                headers={"Accept-Encoding": _ACCEPT_ENCODING},
+            )
+            self._session_loop = loop
+            type(self)._connector_sessions += 1
         return self._session
     
+    async def _get_http2_client(self) -> "httpx.AsyncClient":
+        """Lazy initialization of the httpx HTTP/2 client."""
+        loop = asyncio.get_running_loop()
+        if (
+            self._http2_client is None
+            or self._http2_client.is_closed
+            or self._http2_client_loop is not loop
+        ):
+            self._http2_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                timeout=httpx.Timeout(30, connect=5),
+                headers={"Accept-Encoding": _ACCEPT_ENCODING},
+            )
+            self._http2_client_loop = loop
+        return self._http2_client
+    
+    @contextlib.asynccontextmanager
+    async def _get(self, url):
+        """GET url on the configured transport, yielding an aiohttp-like response."""
+        if self.http2:
+            client = await self._get_http2_client()
+            async with client.stream("GET", str(url)) as resp:
+                yield _HttpxResponse(resp)
+        else:
+            session = await self._get_session()
+            async with session.get(url) as resp:
+                yield resp
+    
     async def close(self):
-        """Close the aiohttp session when done."""
+        """
+        Close the aiohttp session (or httpx client) when done.
+
+        The shared connection pool is closed along with the last open
+        session that uses it.
+        """
         if self._session and not self._session.closed:
+            connector = self._session.connector
             await self._session.close()
+            cls = type(self)
+            if connector is cls._connector:
+                cls._connector_sessions -= 1
+                if cls._connector_sessions <= 0:
+                    await cls.close_connector()
+        if self._http2_client and not self._http2_client.is_closed:
+            await self._http2_client.aclose()
     
-    def parse_pydantic_market(self, market_object: dict) -> Market:
-        """Parse market object into Pydantic Market model."""
-        try:
-            if "clobRewards" in market_object:
-                clob_rewards: list[ClobReward] = []
-                for clob_rewards_obj in market_object["clobRewards"]:
-                    clob_rewards.append(ClobReward(**clob_rewards_obj))
-                market_object["clobRewards"] = clob_rewards
-
-            if "events" in market_object:
-                events: list[PolymarketEvent] = []
-                for market_event_obj in market_object["events"]:
-                    events.append(self.parse_nested_event(market_event_obj))
-                market_object["events"] = events
-
-            # These two fields are returned as stringified lists from API
-            if "outcomePrices" in market_object:
-                market_object["outcomePrices"] = json.loads(
-                    market_object["outcomePrices"]
-                )
-            if "clobTokenIds" in market_object:
-                market_object["clobTokenIds"] = json.loads(
-                    market_object["clobTokenIds"]
-                )
+    @classmethod
+    async def close_connector(cls):
+        """
+        Close the connection pool shared by all client instances.
 
-            return Market(**market_object)
-        except Exception as err:
-            print(f"[parse_market] Caught exception: {err}")
-            print("exception while handling object:", market_object)
-            return None
+        Sessions still open on it stop working; use this to release the
+        pool without closing every client first.
+        """
+        if cls._connector and not cls._connector.closed:
+            await cls._connector.close()
+        cls._connector = None
+        cls._connector_loop = None
+        cls._connector_sessions = 0
     
-    def parse_nested_event(self, event_object: dict) -> PolymarketEvent:
-        """Parse nested event object into Pydantic model."""
-        try:
-            if "tags" in event_object:
-                tags: list[Tag] = []
-                for tag in event_object["tags"]:
-                    tags.append(Tag(**tag))
-                event_object["tags"] = tags
-            return PolymarketEvent(**event_object)
-        except Exception as err:
-            print(f"[parse_event] Caught exception: {err}")
-            print("\n", event_object)
-            return None
+    @staticmethod
+    def shutdown_process_pool():
+        """Shut down the worker processes used to parse large market batches."""
+        global _PROCESS_POOL
+        if _PROCESS_POOL is not None:
+            _PROCESS_POOL.shutdown()
+            _PROCESS_POOL = None
     
-    def parse_pydantic_event(self, event_object: dict) -> PolymarketEvent:
-        """Parse event object into Pydantic model."""
-        try:
-            if "tags" in event_object:
-                tags: list[Tag] = []
-                for tag in event_object["tags"]:
-                    tags.append(Tag(**tag))
-                event_object["tags"] = tags
-            return PolymarketEvent(**event_object)
-        except Exception as err:
-            print(f"[parse_event] Caught exception: {err}")
-            return None
+    def parse_pydantic_market(
+        self, market_object: dict, trust_api: bool = False
+    ) -> Market:
+        """
+        Parse market object into Pydantic Market model.
+
+        With trust_api set, models are built with model_construct() and skip
+        field validation. Only use this for payloads straight from Gamma.
+        """
+        _load_pydantic()
+        return _parse_market(market_object, trust_api)
+    
+    def parse_pydantic_event(
+        self, event_object: dict, trust_api: bool = False
+    ) -> PolymarketEvent:
+        """Parse event object (top-level or nested) into Pydantic model."""
+        _load_pydantic()
+        return _parse_event(event_object, trust_api)
+    
+    # Events nested under a markets response parse exactly like top-level ones
+    parse_nested_event = parse_pydantic_event
     
     async def get_markets(
         self, 
         querystring_params: Optional[Dict] = None,
         parse_pydantic=False,
-        local_file_path=None
-    ) -> List[Dict] | List[Market]:
+        local_file_path=None,
+        trust_api: bool = False,
+        parse_struct: bool = False,
+        stream: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Dict] | List[Market] | List["MarketStruct"]:
         """
         Fetch markets from Gamma API asynchronously.
         
@@ -120,9 +572,18 @@ class AsyncGammaMarketClient:
             querystring_params: Query parameters for the API
             parse_pydantic: Return Pydantic Market objects instead of raw dicts
             local_file_path: Save response to file (for testing)
+            trust_api: Build models without validation (see parse_pydantic_market)
+            parse_struct: Decode straight into MarketStruct objects with msgspec,
+                skipping the intermediate dicts. Call to_pydantic() on an item
+                to get a Market. Unlike parse_pydantic, one invalid market
+                fails the whole page with msgspec.ValidationError.
+            stream: Decode the body incrementally with ijson and parse each
+                market as it arrives instead of buffering the whole response
+            fields: Only keep these keys of each raw market dict. Uses
+                simdjson to skip building objects for the other keys.
         
         Returns:
-            List of Market objects or raw dicts
+            List of Market objects, MarketStruct objects or raw dicts
         """
         if querystring_params is None:
             querystring_params = {}
@@ -131,35 +592,103 @@ class AsyncGammaMarketClient:
             raise Exception(
                 'Cannot use "parse_pydantic" and "local_file" params simultaneously.'
             )
+        if parse_struct and (parse_pydantic or local_file_path is not None):
+            raise Exception(
+                'Cannot combine "parse_struct" with "parse_pydantic" or "local_file".'
+            )
+        if parse_struct and not HAS_MSGSPEC:
+            raise ImportError("msgspec is required. Install with: pip install msgspec")
+        if stream and (parse_struct or local_file_path is not None):
+            raise Exception(
+                'Cannot combine "stream" with "parse_struct" or "local_file".'
+            )
+        if stream and not HAS_IJSON:
+            raise ImportError("ijson is required. Install with: pip install ijson")
+        if fields is not None and (
+            parse_pydantic or parse_struct or stream or local_file_path is not None
+        ):
+            raise Exception('"fields" can only be used when returning raw dicts.')
 
-        session = await self._get_session()
-        
-        async with session.get(self.gamma_markets_endpoint, params=querystring_params) as resp:
+        url = _query_url(self.gamma_markets_endpoint, querystring_params)
+        async with self._get(url) as resp:
             if resp.status == 200:
-                data = await resp.json()
+                if stream:
+                    return await self._stream_markets(resp, parse_pydantic, trust_api)
+
+                raw = await resp.read()
+                if parse_struct:
+                    return _MARKETS_DECODER.decode(raw)
+                if parse_pydantic:
+                    # Validation is CPU-bound, keep it off the event loop so
+                    # other in-flight page requests aren't starved
+                    return await asyncio.to_thread(
+                        self._parse_markets_bulk, raw, trust_api
+                    )
+
+                if fields is not None:
+                    return _project_markets(raw, fields)
+
+                data = _json_loads(raw)
                 
                 if local_file_path is not None:
                     with open(local_file_path, "w+") as out_file:
-                        json.dump(data, out_file)
-                elif not parse_pydantic:
-                    return data
+                        out_file.write(_json_dumps(data))
                 else:
-                    markets: list[Market] = []
-                    for market_object in data:
-                        parsed = self.parse_pydantic_market(market_object)
-                        if parsed:
-                            markets.append(parsed)
-                    return markets
+                    return data
             else:
                 print(f"Error response from API: HTTP {resp.status}")
                 raise Exception(f"Gamma API error: HTTP {resp.status}")
     
+    def _parse_markets_bulk(self, raw: bytes, trust_api: bool) -> List[Market]:
+        """Parse a raw /markets response body into Market models."""
+        _load_pydantic()
+        if not trust_api:
+            try:
+                return _MARKETS_ADAPTER.validate_json(raw)
+            except _VALIDATION_ERROR as err:
+                return _validate_list(
+                    _MARKETS_ADAPTER, _json_loads(raw), "get_markets", err
+                )
+        
+        markets = [
+            _parse_market(market_object, trust_api)
+            for market_object in _json_loads(raw)
+        ]
+        return [market for market in markets if market]
+    
+    async def _stream_markets(
+        self,
+        resp: "aiohttp.ClientResponse | _HttpxResponse",
+        parse_pydantic: bool,
+        trust_api: bool,
+    ) -> List[Dict] | List[Market]:
+        """
+        Decode markets one at a time while the response body is downloading.
+
+        JSON decoding overlaps the download and the raw body is never held
+        in full, but every decoded market dict is kept until the end. Models
+        are then built in one batch off the event loop, as get_markets()
+        does for buffered responses, so invalid markets are dropped the same
+        way.
+        """
+        markets = [
+            market_object
+            async for market_object in ijson.items(
+                resp.content, "item", buf_size=65536, use_float=True
+            )
+        ]
+        if parse_pydantic:
+            return await asyncio.to_thread(_parse_market_chunk, markets, trust_api)
+        return markets
+    
     async def get_events(
         self,
         querystring_params: Optional[Dict] = None,
         parse_pydantic=False,
-        local_file_path=None
-    ) -> List[Dict] | List[PolymarketEvent]:
+        local_file_path=None,
+        trust_api: bool = False,
+        parse_struct: bool = False,
+    ) -> List[Dict] | List[PolymarketEvent] | List["EventStruct"]:
         """
         Fetch events from Gamma API asynchronously.
         
@@ -167,9 +696,13 @@ class AsyncGammaMarketClient:
             querystring_params: Query parameters for the API
             parse_pydantic: Return Pydantic PolymarketEvent objects
             local_file_path: Save response to file
+            trust_api: Build models without validation (see parse_pydantic_market)
+            parse_struct: Decode straight into EventStruct objects with msgspec.
+                Unlike parse_pydantic, one invalid event fails the whole page
+                with msgspec.ValidationError.
         
         Returns:
-            List of PolymarketEvent objects or raw dicts
+            List of PolymarketEvent objects, EventStruct objects or raw dicts
         """
         if querystring_params is None:
             querystring_params = {}
@@ -178,22 +711,40 @@ class AsyncGammaMarketClient:
             raise Exception(
                 'Cannot use "parse_pydantic" and "local_file" params simultaneously.'
             )
+        if parse_struct and (parse_pydantic or local_file_path is not None):
+            raise Exception(
+                'Cannot combine "parse_struct" with "parse_pydantic" or "local_file".'
+            )
+        if parse_struct and not HAS_MSGSPEC:
+            raise ImportError("msgspec is required. Install with: pip install msgspec")
 
-        session = await self._get_session()
-        
-        async with session.get(self.gamma_events_endpoint, params=querystring_params) as resp:
+        url = _query_url(self.gamma_events_endpoint, querystring_params)
+        async with self._get(url) as resp:
             if resp.status == 200:
-                data = await resp.json()
+                raw = await resp.read()
+                if parse_struct:
+                    return _EVENTS_DECODER.decode(raw)
+                if parse_pydantic and not trust_api:
+                    _load_pydantic()
+                    try:
+                        return _EVENTS_ADAPTER.validate_json(raw)
+                    except _VALIDATION_ERROR as err:
+                        return _validate_list(
+                            _EVENTS_ADAPTER, _json_loads(raw), "get_events", err
+                        )
+
+                data = _json_loads(raw)
                 
                 if local_file_path is not None:
                     with open(local_file_path, "w+") as out_file:
-                        json.dump(data, out_file)
+                        out_file.write(_json_dumps(data))
                 elif not parse_pydantic:
                     return data
                 else:
+                    _load_pydantic()
                     events: list[PolymarketEvent] = []
                     for market_event_obj in data:
-                        parsed = self.parse_pydantic_event(market_event_obj)
+                        parsed = _parse_event(market_event_obj, trust_api)
                         if parsed:
                             events.append(parsed)
                     return events
@@ -211,115 +762,194 @@ class AsyncGammaMarketClient:
     async def get_current_markets(self, limit: int = 4) -> List[Dict]:
         """Fetch currently active markets."""
         return await self.get_markets(
-            querystring_params={
-                "active": True,
-                "closed": False,
-                "archived": False,
-                "limit": limit,
-            }
+            querystring_params={**_ACTIVE_BASE, "limit": limit}
+        )
+    
+    async def _probe_market_total(self, querystring_params: Dict) -> Optional[int]:
+        """
+        Return the total number of markets matching querystring_params.
+
+        Asks for a single market and reads the X-Total-Count header. Returns
+        None when the count is unavailable, so callers fall back to fetching
+        up to max_pages. Only a successful response without the header marks
+        the count as unsupported; errors are retried on the next call.
+        """
+        if type(self)._total_count_supported is False:
+            return None
+        
+        url = _query_url(
+            self.gamma_markets_endpoint, {**querystring_params, "limit": 1}
         )
+        try:
+            async with self._get(url) as resp:
+                await resp.read()
+                status = resp.status
+                header = resp.headers.get("X-Total-Count")
+        except Exception as err:
+            print(f"Error probing market count: {err}")
+            return None
+        
+        if status != 200:
+            return None
+        try:
+            total = int(header)
+        except (TypeError, ValueError):
+            type(self)._total_count_supported = False
+            return None
+        type(self)._total_count_supported = True
+        return total
     
     async def get_all_current_markets(
         self, 
         limit: int = 100, 
-        max_pages: int = 10
-    ) -> List[Dict]:
+        max_pages: int = 10,
+        parse_pydantic: bool = False,
+        trust_api: bool = False,
+        use_processes: bool = False,
+    ) -> List[Dict] | List[Market]:
         """
         Fetch all active markets concurrently.
         
         Args:
             limit: Markets per page
             max_pages: Maximum pages to fetch (safety limit)
+            parse_pydantic: Return Pydantic Market objects instead of raw dicts
+            trust_api: Build models without validation (see parse_pydantic_market)
+            use_processes: Parse large results across a process pool instead
+                of a single worker thread. Workers are spawned and re-import
+                the calling script, so it must guard its entry point with
+                if __name__ == "__main__". Call shutdown_process_pool() when
+                done.
         
         Returns:
             List of all active markets
         
-        Performance: Fetches all pages concurrently using asyncio.gather()
-        instead of sequentially, reducing total time dramatically.
+        Performance: Fires every page request at once with asyncio.gather()
+        and trims the result afterwards, so no page waits on another. When
+        the API reports a total count, only the pages that exist are fetched.
         """
-        tasks = []
+        if limit <= 0:
+            raise Exception('"limit" must be a positive number of markets per page.')
         
-        # Fetch first page to determine total
-        first_page = await self.get_markets(
-            querystring_params={
-                "active": True,
-                "closed": False,
-                "archived": False,
-                "limit": limit,
-                "offset": 0,
-            }
-        )
+        # Cap at max_pages for safety
+        num_pages = min(max_pages, 10)  # Cap at 10 pages for now
         
-        if len(first_page) == 0:
-            return first_page
+        total = await self._probe_market_total(_ACTIVE_BASE)
+        if total is not None:
+            num_pages = min(num_pages, math.ceil(total / limit))
         
-        all_markets = first_page
+        tasks = [
+            self.get_markets(
+                querystring_params={
+                    **_ACTIVE_BASE,
+                    "limit": limit,
+                    "offset": page * limit,
+                }
+            )
+            for page in range(num_pages)
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
         
-        # If more markets exist, fetch remaining pages concurrently
-        if len(first_page) == limit:
-            # Estimate total pages (cap at max_pages for safety)
-            num_pages = min(max_pages, 10)  # Cap at 10 pages for now
+        all_markets = []
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"Error fetching market page: {result}")
+                continue
             
-            for page in range(1, num_pages):
-                offset = page * limit
-                task = self.get_markets(
-                    querystring_params={
-                        "active": True,
-                        "closed": False,
-                        "archived": False,
-                        "limit": limit,
-                        "offset": offset,
-                    }
-                )
-                tasks.append(task)
+            all_markets.extend(result)
             
-            # Fetch all pages concurrently
-            if tasks:
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                for result in results:
-                    if isinstance(result, Exception):
-                        print(f"Error fetching market page: {result}")
-                    elif result:
-                        all_markets.extend(result)
-                        
-                        # Stop if we got fewer results than limit
-                        if len(result) < limit:
-                            break
+            # Stop at the first short page, later pages are past the end
+            if len(result) < limit:
+                break
         
         print(f"Fetched {len(all_markets)} total markets")
+        if parse_pydantic:
+            return await self._parse_markets_parallel(
+                all_markets, trust_api, use_processes
+            )
         return all_markets
     
+    async def _parse_markets_parallel(
+        self, market_objects: List[Dict], trust_api: bool, use_processes: bool
+    ) -> List[Market]:
+        """
+        Parse raw market dicts off the event loop.
+
+        With use_processes, large batches are sharded across processes. Small
+        batches always go to a worker thread, where pickling the chunks to
+        another process would cost more than it saves.
+        """
+        if not use_processes or len(market_objects) < _PROCESS_POOL_MIN_MARKETS:
+            return await asyncio.to_thread(
+                _parse_market_chunk, market_objects, trust_api
+            )
+        
+        loop = asyncio.get_running_loop()
+        pool = _get_process_pool()
+        chunks = [
+            market_objects[i : i + _PARSE_CHUNK_SIZE]
+            for i in range(0, len(market_objects), _PARSE_CHUNK_SIZE)
+        ]
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(pool, _parse_market_chunk, chunk, trust_api)
+                for chunk in chunks
+            )
+        )
+        return [market for chunk in results for market in chunk]
+    
     async def get_current_events(self, limit: int = 4) -> List[Dict]:
         """Fetch currently active events."""
         return await self.get_events(
-            querystring_params={
-                "active": True,
-                "closed": False,
-                "archived": False,
-                "limit": limit,
-            }
+            querystring_params={**_ACTIVE_BASE, "limit": limit}
         )
     
     async def get_clob_tradable_markets(self, limit: int = 2) -> List[Dict]:
         """Fetch markets with enabled order books."""
         return await self.get_markets(
             querystring_params={
-                "active": True,
-                "closed": False,
-                "archived": False,
+                **_ACTIVE_BASE,
                 "limit": limit,
-                "enableOrderBook": True,
+                "enableOrderBook": "true",
             }
         )
     
     async def get_market(self, market_id: str) -> Dict:
-        """Fetch a single market by ID."""
+        """
+        Fetch a single market by ID.
+        
+        Concurrent calls for the same ID share one request, and results are
+        reused for a couple of seconds. Callers get the same dict back, so
+        copy it before mutating.
+        """
+        key = str(market_id)
+        if self._market_cache is not None:
+            # A single lookup, so an entry can't expire between check and read
+            cached = self._market_cache.get(key)
+            if cached is not None:
+                return cached
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_market(key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shield so one cancelled caller doesn't cancel the shared request
+        return await asyncio.shield(task)
+    
+    async def _fetch_market(self, market_id: str) -> Dict:
+        """Fetch a single market by ID, bypassing coalescing and the cache."""
         url = f"{self.gamma_markets_endpoint}/{market_id}"
-        session = await self._get_session()
         
-        async with session.get(url) as resp:
-            return await resp.json()
+        async with self._get(url) as resp:
+            market = _json_loads(await resp.read())
+            status = resp.status
+        
+        # Error bodies are passed through as before but never cached
+        if self._market_cache is not None and status == 200:
+            self._market_cache[market_id] = market
+        return market
 
 
 # Convenience alias for backward compatibility
@@ -346,5 +976,17 @@ if __name__ == "__main__":
             
         finally:
             await gamma.close()
+            await AsyncGammaMarketClient.close_connector()
+            AsyncGammaMarketClient.shutdown_process_pool()
     
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        if hasattr(uvloop, "run"):
+            uvloop.run(main())
+        else:
+            # uvloop < 0.18 has no run(); install() is deprecated after that
+            uvloop.install()
+            asyncio.run(main())
\ No newline at end of file
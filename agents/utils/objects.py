@@ -1,6 +1,30 @@
 from __future__ import annotations
-from typing import Optional, Union
-from pydantic import BaseModel
+import json
+from array import array
+from typing import Annotated, Optional, Union
+from pydantic import (
+    BaseModel,
+    PlainSerializer,
+    PlainValidator,
+    WithJsonSchema,
+    field_validator,
+)
+
+from .parsing import parse_outcome_prices
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+OutcomePrices = Annotated[
+    array,
+    PlainValidator(parse_outcome_prices),
+    PlainSerializer(list),
+    WithJsonSchema({"type": "array", "items": {"type": "number"}}),
+]
 
 
 class Trade(BaseModel):
@@ -114,7 +138,7 @@ class Market(BaseModel):
     icon: Optional[str] = None
     description: Optional[str] = None
     outcome: Optional[list] = None
-    outcomePrices: Optional[list] = None
+    outcomePrices: Optional[OutcomePrices] = None
     volume: Optional[float] = None
     active: Optional[bool] = None
     closed: Optional[bool] = None
@@ -167,6 +191,14 @@ class Market(BaseModel):
     rewardsMaxSpread: Optional[float] = None
     spread: Optional[float] = None
 
+    @field_validator("clobTokenIds", mode="before")
+    @classmethod
+    def parse_stringified_list(cls, value):
+        # Returned as a stringified list from the api
+        if isinstance(value, str):
+            return orjson.loads(value) if HAS_ORJSON else json.loads(value)
+        return value
+
 
 class ComplexMarket(BaseModel):
     id: int
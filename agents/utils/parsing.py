@@ -0,0 +1,38 @@
+"""
+Helpers for fields the Gamma API returns in awkward shapes.
+
+Kept free of pydantic and msgspec so either model layer can share them.
+"""
+
+from array import array
+from collections.abc import Mapping
+
+
+def parse_outcome_prices(value) -> array:
+    """
+    Parse outcome prices into a compact array of doubles.
+
+    The api returns them as a stringified list of quoted numbers, e.g.
+    '["0.45", "0.55"]', which is split directly instead of going through a
+    JSON parser and a list of float objects.
+
+    Raises ValueError for anything that isn't a list of numbers, so pydantic
+    reports it as a validation error for the field.
+    """
+    if isinstance(value, array):
+        return value
+    # Both iterate without error but would yield byte values or keys
+    if isinstance(value, (bytes, bytearray, memoryview, Mapping)):
+        raise ValueError(f"Unsupported outcome prices: {value!r}")
+    if isinstance(value, str):
+        value = value.strip()
+        if not (value.startswith("[") and value.endswith("]")):
+            raise ValueError(f"Outcome prices must be a list: {value!r}")
+        value = value[1:-1]
+        if not value.strip():
+            return array("d")
+        value = [part.strip().strip('"') for part in value.split(",")]
+    try:
+        return array("d", map(float, value))
+    except TypeError as err:
+        raise ValueError(f"Unsupported outcome prices: {value!r}") from err
@@ -0,0 +1,165 @@
+"""
+msgspec Struct mirrors of the Gamma API models in objects.py.
+
+These decode straight from response bytes in a single pass and expose the
+same attributes as the Pydantic models. Pydantic is only imported when an
+object is converted with to_pydantic().
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional, Union
+
+import msgspec
+
+from .parsing import parse_outcome_prices
+
+if TYPE_CHECKING:
+    from .objects import Market, PolymarketEvent, ClobReward, Tag
+
+
+class ClobRewardStruct(msgspec.Struct, kw_only=True, omit_defaults=True):
+    id: str  # returned as string in api but really an int?
+    conditionId: str
+    assetAddress: str
+    rewardsAmount: float  # only seen 0 but could be float?
+    rewardsDailyRate: int  # only seen ints but could be float?
+    startDate: str  # yyyy-mm-dd formatted date string
+    endDate: str  # yyyy-mm-dd formatted date string
+
+    def to_pydantic(self) -> ClobReward:
+        from .objects import ClobReward
+
+        return ClobReward(**msgspec.to_builtins(self))
+
+
+class TagStruct(msgspec.Struct, kw_only=True, omit_defaults=True):
+    id: str
+    label: Optional[str] = None
+    slug: Optional[str] = None
+    forceShow: Optional[bool] = None  # missing from current events data
+    createdAt: Optional[str] = None  # missing from events data
+    updatedAt: Optional[str] = None  # missing from current events data
+
+    def to_pydantic(self) -> Tag:
+        from .objects import Tag
+
+        return Tag(**msgspec.to_builtins(self))
+
+
+class EventStruct(msgspec.Struct, kw_only=True, omit_defaults=True):
+    id: str  # "11421"
+    ticker: Optional[str] = None
+    slug: Optional[str] = None
+    title: Optional[str] = None
+    startDate: Optional[str] = None
+    creationDate: Optional[str] = (
+        None  # fine in market event but missing from events response
+    )
+    endDate: Optional[str] = None
+    image: Optional[str] = None
+    icon: Optional[str] = None
+    active: Optional[bool] = None
+    closed: Optional[bool] = None
+    archived: Optional[bool] = None
+    new: Optional[bool] = None
+    featured: Optional[bool] = None
+    restricted: Optional[bool] = None
+    liquidity: Optional[float] = None
+    volume: Optional[float] = None
+    reviewStatus: Optional[str] = None
+    createdAt: Optional[str] = None  # 2024-07-08T01:06:23.982796Z,
+    updatedAt: Optional[str] = None  # 2024-07-15T17:12:48.601056Z,
+    competitive: Optional[float] = None
+    volume24hr: Optional[float] = None
+    enableOrderBook: Optional[bool] = None
+    liquidityClob: Optional[float] = None
+    commentCount: Optional[int] = None
+    markets: Optional[list[MarketStruct]] = None
+    tags: Optional[list[TagStruct]] = None
+    cyom: Optional[bool] = None
+    showAllOutcomes: Optional[bool] = None
+    showMarketImages: Optional[bool] = None
+
+    def to_pydantic(self) -> PolymarketEvent:
+        from .objects import PolymarketEvent
+
+        return PolymarketEvent(**msgspec.to_builtins(self))
+
+
+class MarketStruct(msgspec.Struct, kw_only=True, omit_defaults=True):
+    id: int
+    question: Optional[str] = None
+    conditionId: Optional[str] = None
+    slug: Optional[str] = None
+    resolutionSource: Optional[str] = None
+    endDate: Optional[str] = None
+    liquidity: Optional[float] = None
+    startDate: Optional[str] = None
+    image: Optional[str] = None
+    icon: Optional[str] = None
+    description: Optional[str] = None
+    outcome: Optional[list] = None
+    outcomePrices: Optional[Union[list[float], str]] = None
+    volume: Optional[float] = None
+    active: Optional[bool] = None
+    closed: Optional[bool] = None
+    marketMakerAddress: Optional[str] = None
+    createdAt: Optional[str] = None  # date type worth enforcing for dates?
+    updatedAt: Optional[str] = None
+    new: Optional[bool] = None
+    featured: Optional[bool] = None
+    submitted_by: Optional[str] = None
+    archived: Optional[bool] = None
+    resolvedBy: Optional[str] = None
+    restricted: Optional[bool] = None
+    groupItemTitle: Optional[str] = None
+    groupItemThreshold: Optional[int] = None
+    questionID: Optional[str] = None
+    enableOrderBook: Optional[bool] = None
+    orderPriceMinTickSize: Optional[float] = None
+    orderMinSize: Optional[int] = None
+    volumeNum: Optional[float] = None
+    liquidityNum: Optional[float] = None
+    endDateIso: Optional[str] = None  # iso format date = None
+    startDateIso: Optional[str] = None
+    hasReviewedDates: Optional[bool] = None
+    volume24hr: Optional[float] = None
+    clobTokenIds: Optional[Union[list, str]] = None
+    umaBond: Optional[int] = None  # returned as string from api?
+    umaReward: Optional[int] = None  # returned as string from api?
+    volume24hrClob: Optional[float] = None
+    volumeClob: Optional[float] = None
+    liquidityClob: Optional[float] = None
+    acceptingOrders: Optional[bool] = None
+    negRisk: Optional[bool] = None
+    commentCount: Optional[int] = None
+    events: Optional[list[EventStruct]] = None
+    ready: Optional[bool] = None
+    deployed: Optional[bool] = None
+    funded: Optional[bool] = None
+    deployedTimestamp: Optional[str] = None  # utc z datetime string
+    acceptingOrdersTimestamp: Optional[str] = None  # utc z datetime string,
+    cyom: Optional[bool] = None
+    competitive: Optional[float] = None
+    pagerDutyNotificationEnabled: Optional[bool] = None
+    reviewStatus: Optional[str] = None  # deployed, draft, etc.
+    approved: Optional[bool] = None
+    clobRewards: Optional[list[ClobRewardStruct]] = None
+    rewardsMinSize: Optional[int] = (
+        None  # would make sense to allow float but we'll see
+    )
+    rewardsMaxSpread: Optional[float] = None
+    spread: Optional[float] = None
+
+    def __post_init__(self):
+        # These two fields are returned as stringified lists from the api.
+        # Prices are kept as a list so msgspec can still encode the struct.
+        if self.outcomePrices is not None:
+            self.outcomePrices = parse_outcome_prices(self.outcomePrices).tolist()
+        if isinstance(self.clobTokenIds, str):
+            self.clobTokenIds = msgspec.json.decode(self.clobTokenIds)
+
+    def to_pydantic(self) -> Market:
+        from .objects import Market
+
+        return Market(**msgspec.to_builtins(self))
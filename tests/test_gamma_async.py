@@ -0,0 +1,248 @@
+"""
+AsyncGammaMarketClient against a local stand-in for the Gamma API.
+
+% python -m unittest discover -s tests
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+from unittest import mock
+
+# The client imports itself as agents.agents.*, so the repository's parent
+# directory has to be importable
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+from agents.agents.polymarket import gamma_async  # noqa: E402
+from agents.agents.polymarket.gamma_async import AsyncGammaMarketClient  # noqa: E402
+
+
+class TestQueryUrl(unittest.TestCase):
+    endpoint = "https://gamma-api.polymarket.com/markets"
+
+    def test_same_params_reuse_one_url(self):
+        first = gamma_async._query_url(self.endpoint, {"limit": 10, "offset": 20})
+        second = gamma_async._query_url(self.endpoint, {"offset": 20, "limit": 10})
+        self.assertIs(first, second)
+        self.assertEqual(first.query_string, "limit=10&offset=20")
+
+    def test_equal_values_of_different_types_are_kept_apart(self):
+        as_int = gamma_async._query_url(self.endpoint, {"offset": 100})
+        as_float = gamma_async._query_url(self.endpoint, {"offset": 100.0})
+        self.assertEqual(as_int.query_string, "offset=100")
+        self.assertEqual(as_float.query_string, "offset=100.0")
+
+    def test_bool_is_rejected_even_after_int_is_cached(self):
+        gamma_async._query_url(self.endpoint, {"limit": 1})
+        with self.assertRaises(TypeError):
+            gamma_async._query_url(self.endpoint, {"limit": True})
+
+    def test_unhashable_values_are_encoded_uncached(self):
+        url = gamma_async._query_url(self.endpoint, {"id": [1, 2]})
+        self.assertEqual(url.query_string, "id=1&id=2")
+
+
+class TestLazyModels(unittest.TestCase):
+    def test_public_names_resolve_to_pydantic_objects(self):
+        from pydantic import ValidationError
+
+        from agents.agents.polymarket.gamma_async import Market
+        from agents.agents.utils import objects
+
+        self.assertIs(Market, objects.Market)
+        self.assertIs(gamma_async.PolymarketEvent, objects.PolymarketEvent)
+        self.assertIs(gamma_async.ValidationError, ValidationError)
+
+    def test_unknown_name_raises_attribute_error(self):
+        with self.assertRaises(AttributeError):
+            gamma_async.NotAModel
+
+
+class TestProjectMarkets(unittest.TestCase):
+    raw = (
+        b'[{"id": "1", "slug": "a", "events": [{"id": "9"}], "clobRewards": {"x": 1}},'
+        b' {"id": "2", "question": "q"}]'
+    )
+
+    def project(self):
+        return gamma_async._project_markets(self.raw, ["id", "events", "clobRewards"])
+
+    def test_keeps_only_requested_fields(self):
+        self.assertEqual(
+            self.project(),
+            [
+                {"id": "1", "events": [{"id": "9"}], "clobRewards": {"x": 1}},
+                {"id": "2"},
+            ],
+        )
+
+    def test_stdlib_fallback_matches(self):
+        expected = self.project()
+        with mock.patch.object(gamma_async, "HAS_SIMDJSON", False):
+            self.assertEqual(self.project(), expected)
+
+
+class GammaServerTestCase(unittest.IsolatedAsyncioTestCase):
+    """Runs a local aiohttp app and points a client at it."""
+
+    async def asyncSetUp(self):
+        self.requests = []
+        self.market_delay = 0
+        self.market_status = 200
+        self.total_markets = 0
+        self.total_header = False
+        self.probe_status = 200
+
+        app = web.Application()
+        app.router.add_get("/markets", self.handle_markets)
+        app.router.add_get("/markets/{id}", self.handle_market)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+        self.client = AsyncGammaMarketClient()
+        self.client.gamma_url = str(self.server.make_url("")).rstrip("/")
+        self.client.gamma_markets_endpoint = self.client.gamma_url + "/markets"
+        self.client.gamma_events_endpoint = self.client.gamma_url + "/events"
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await self.server.close()
+
+    async def handle_markets(self, request):
+        self.requests.append(dict(request.query))
+        limit = int(request.query.get("limit", 100))
+        offset = int(request.query.get("offset", 0))
+        if limit == 1 and self.probe_status != 200:
+            return web.json_response([], status=self.probe_status)
+        markets = [
+            {"id": str(i), "question": f"q{i}", "slug": f"m-{i}"}
+            for i in range(offset, min(offset + limit, self.total_markets))
+        ]
+        headers = {}
+        if self.total_header:
+            headers["X-Total-Count"] = str(self.total_markets)
+        return web.json_response(markets, headers=headers)
+
+    async def handle_market(self, request):
+        self.requests.append(request.path)
+        await asyncio.sleep(self.market_delay)
+        market_id = request.match_info["id"]
+        if self.market_status != 200:
+            return web.json_response({"error": "nope"}, status=self.market_status)
+        return web.json_response({"id": market_id})
+
+
+class TestGetMarket(GammaServerTestCase):
+    async def test_concurrent_calls_share_one_request(self):
+        self.market_delay = 0.05
+        results = await asyncio.gather(
+            *(self.client.get_market("7") for _ in range(10))
+        )
+        self.assertEqual(results, [{"id": "7"}] * 10)
+        self.assertEqual(len(self.requests), 1)
+
+    async def test_successful_response_is_cached(self):
+        await self.client.get_market("7")
+        self.assertEqual(await self.client.get_market(7), {"id": "7"})
+        self.assertEqual(len(self.requests), 1)
+
+    async def test_error_response_is_not_cached(self):
+        self.market_status = 404
+        self.assertEqual(await self.client.get_market("7"), {"error": "nope"})
+        self.market_status = 200
+        self.assertEqual(await self.client.get_market("7"), {"id": "7"})
+        self.assertEqual(len(self.requests), 2)
+
+    async def test_cancelled_caller_does_not_cancel_shared_request(self):
+        self.market_delay = 0.05
+        first = asyncio.ensure_future(self.client.get_market("7"))
+        second = asyncio.ensure_future(self.client.get_market("7"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        self.assertEqual(await second, {"id": "7"})
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+        self.assertEqual(len(self.requests), 1)
+
+    async def test_request_finishes_after_every_caller_is_cancelled(self):
+        self.market_delay = 0.05
+        caller = asyncio.ensure_future(self.client.get_market("7"))
+        await asyncio.sleep(0.01)
+        caller.cancel()
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(await self.client.get_market("7"), {"id": "7"})
+        self.assertEqual(len(self.requests), 1)
+
+
+
+class TestGetAllCurrentMarkets(GammaServerTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.total_markets = 25
+        # Whether the count header is supported is remembered per class
+        AsyncGammaMarketClient._total_count_supported = None
+        self.addCleanup(setattr, AsyncGammaMarketClient, "_total_count_supported", None)
+
+    def page_requests(self):
+        return [query for query in self.requests if query.get("limit") != "1"]
+
+    async def test_short_page_ends_results_without_count(self):
+        markets = await self.client.get_all_current_markets(limit=10, max_pages=5)
+        self.assertEqual([m["id"] for m in markets], [str(i) for i in range(25)])
+        # Every page is requested up front, the extra ones are trimmed
+        self.assertEqual(len(self.page_requests()), 5)
+        self.assertIs(AsyncGammaMarketClient._total_count_supported, False)
+
+    async def test_count_limits_pages_requested(self):
+        self.total_header = True
+        markets = await self.client.get_all_current_markets(limit=10, max_pages=5)
+        self.assertEqual(len(markets), 25)
+        self.assertEqual(len(self.page_requests()), 3)
+        self.assertIs(AsyncGammaMarketClient._total_count_supported, True)
+
+    async def test_missing_count_skips_later_probes(self):
+        await self.client.get_all_current_markets(limit=10, max_pages=5)
+        self.requests.clear()
+        await self.client.get_all_current_markets(limit=10, max_pages=5)
+        self.assertEqual(len(self.requests), len(self.page_requests()))
+
+    async def test_failed_probe_falls_back_and_keeps_probing(self):
+        self.probe_status = 429
+        markets = await self.client.get_all_current_markets(limit=10, max_pages=5)
+        self.assertEqual(len(markets), 25)
+        self.assertIsNone(AsyncGammaMarketClient._total_count_supported)
+
+    async def test_unreachable_probe_returns_none(self):
+        self.client.gamma_markets_endpoint = "http://127.0.0.1:1/markets"
+        self.assertIsNone(await self.client._probe_market_total({}))
+        self.assertIsNone(AsyncGammaMarketClient._total_count_supported)
+
+    async def test_non_positive_limit_is_rejected(self):
+        with self.assertRaises(Exception):
+            await self.client.get_all_current_markets(limit=0)
+
+
+
+class TestGetMarketsFields(GammaServerTestCase):
+    async def test_fields_projects_raw_markets(self):
+        self.total_markets = 2
+        markets = await self.client.get_markets({"limit": 5}, fields=["id", "slug"])
+        self.assertEqual(
+            markets, [{"id": "0", "slug": "m-0"}, {"id": "1", "slug": "m-1"}]
+        )
+
+    async def test_fields_rejected_with_parsing(self):
+        with self.assertRaises(Exception):
+            await self.client.get_markets(fields=["id"], parse_pydantic=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Parsing helpers shared by the Gamma clients.
+
+% python -m unittest discover -s tests
+"""
+
+import contextlib
+import io
+import os
+import sys
+import unittest
+from array import array
+
+# The client imports itself as agents.agents.*, so the repository's parent
+# directory has to be importable
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from agents.agents.polymarket import gamma_async  # noqa: E402
+from agents.agents.utils.parsing import parse_outcome_prices  # noqa: E402
+
+
+class TestParseOutcomePrices(unittest.TestCase):
+    def test_quoted(self):
+        self.assertEqual(
+            parse_outcome_prices('["0.45", "0.55"]'), array("d", [0.45, 0.55])
+        )
+
+    def test_unquoted(self):
+        self.assertEqual(parse_outcome_prices("[0.45, 0.55]"), array("d", [0.45, 0.55]))
+
+    def test_empty(self):
+        self.assertEqual(parse_outcome_prices("[]"), array("d"))
+        self.assertEqual(parse_outcome_prices(" [ ] "), array("d"))
+
+    def test_already_parsed(self):
+        self.assertEqual(parse_outcome_prices(["0.5", 0.5]), array("d", [0.5, 0.5]))
+        prices = array("d", [1.0])
+        self.assertIs(parse_outcome_prices(prices), prices)
+
+    def test_invalid_raises_value_error(self):
+        invalid = (
+            5,
+            None,
+            [None],
+            '["abc"]',
+            "0.5",
+            '"0.5"',
+            b'["0.1"]',
+            bytearray(b"[0.1]"),
+            {"0.5": 1},
+        )
+        for value in invalid:
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    parse_outcome_prices(value)
+
+
+class TestOutcomePricesSchema(unittest.TestCase):
+    def test_models_have_json_schema(self):
+        from agents.agents.utils.objects import Market, PolymarketEvent
+
+        schema = Market.model_json_schema()["$defs"]["Market"]
+        self.assertIn(
+            {"type": "array", "items": {"type": "number"}},
+            schema["properties"]["outcomePrices"]["anyOf"],
+        )
+        self.assertIn("$defs", PolymarketEvent.model_json_schema())
+
+
+class TestValidateList(unittest.TestCase):
+    def setUp(self):
+        gamma_async._load_pydantic()
+
+    def validate(self, items):
+        # _validate_list reports what it drops on stdout
+        with contextlib.redirect_stdout(io.StringIO()):
+            return gamma_async._validate_list(
+                gamma_async._MARKETS_ADAPTER, items, "test"
+            )
+
+    def test_all_valid(self):
+        markets = self.validate([{"id": "1"}, {"id": 2}])
+        self.assertEqual([market.id for market in markets], [1, 2])
+
+    def test_drops_only_invalid_entries(self):
+        items = [
+            {"id": "1", "outcomePrices": '["0.4", "0.6"]'},
+            {"id": "not a number"},
+            {"id": "3", "outcomePrices": 5},
+            {"id": "4", "events": [{"id": "9", "tags": [{"label": "no id"}]}]},
+            {"id": "5", "events": [{"id": "9", "tags": [{"id": "t"}]}]},
+        ]
+        markets = self.validate(items)
+        self.assertEqual([market.id for market in markets], [1, 5])
+        self.assertEqual(markets[0].outcomePrices, array("d", [0.4, 0.6]))
+        self.assertEqual(markets[1].events[0].tags[0].id, "t")
+
+    def test_reuses_existing_error(self):
+        items = [{"id": "x"}, {"id": "2"}]
+        with self.assertRaises(gamma_async.ValidationError) as ctx:
+            gamma_async._MARKETS_ADAPTER.validate_python(items)
+        with contextlib.redirect_stdout(io.StringIO()):
+            markets = gamma_async._validate_list(
+                gamma_async._MARKETS_ADAPTER, items, "test", ctx.exception
+            )
+        self.assertEqual([market.id for market in markets], [2])
+
+    def test_non_list_body_yields_nothing(self):
+        self.assertEqual(self.validate({"error": "rate limited"}), [])
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            client = gamma_async.AsyncGammaMarketClient()
+            self.assertEqual(client._parse_markets_bulk(b'{"error": "x"}', False), [])
+        self.assertNotIn("Dropping", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
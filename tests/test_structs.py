@@ -0,0 +1,62 @@
+"""
+msgspec struct mirrors of the Gamma models.
+
+% python -m unittest discover -s tests
+"""
+
+import os
+import sys
+import unittest
+
+# The models import each other as agents.agents.*, so the repository's parent
+# directory has to be importable
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+import msgspec  # noqa: E402
+
+from agents.agents.utils import objects, structs  # noqa: E402
+
+
+class TestStructFields(unittest.TestCase):
+    def test_structs_match_models(self):
+        pairs = [
+            (structs.ClobRewardStruct, objects.ClobReward),
+            (structs.TagStruct, objects.Tag),
+            (structs.EventStruct, objects.PolymarketEvent),
+            (structs.MarketStruct, objects.Market),
+        ]
+        for struct, model in pairs:
+            with self.subTest(struct=struct.__name__):
+                self.assertEqual(
+                    list(struct.__struct_fields__), list(model.model_fields)
+                )
+
+
+class TestMarketStruct(unittest.TestCase):
+    def test_decode_encode_round_trip(self):
+        raw = (
+            b'{"id": "1", "outcomePrices": "[\\"0.4\\", \\"0.6\\"]",'
+            b' "clobTokenIds": "[\\"123\\"]", "events": [{"id": "9"}]}'
+        )
+        market = msgspec.json.decode(raw, type=structs.MarketStruct, strict=False)
+        self.assertEqual(market.outcomePrices, [0.4, 0.6])
+        self.assertEqual(market.clobTokenIds, ["123"])
+        self.assertEqual(
+            msgspec.json.decode(msgspec.json.encode(market)),
+            {
+                "id": 1,
+                "outcomePrices": [0.4, 0.6],
+                "clobTokenIds": ["123"],
+                "events": [{"id": "9"}],
+            },
+        )
+
+    def test_to_pydantic(self):
+        market = structs.MarketStruct(id=1, outcomePrices="[0.4, 0.6]")
+        self.assertEqual(list(market.to_pydantic().outcomePrices), [0.4, 0.6])
+
+
+if __name__ == "__main__":
+    unittest.main()